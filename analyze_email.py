@@ -1,15 +1,17 @@
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 import openai
 
-def analyze_email(email_content):
-    # Load environment variables from .env file
-    load_dotenv()
+# Bounds how long a request can hold up a check, or closing the app while one is in flight.
+# A request that still fails is retried on the next check, since the UID watermark stops there.
+REQUEST_TIMEOUT_SECONDS = 30
+REQUEST_MAX_RETRIES = 1
 
-    # Initialize the OpenAI client with the API key
-    client = openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
-    
-    prompt = f"""
+SYSTEM_PROMPT = "You are an AI assistant that analyzes emails and extracts job application information. You always and only respond with valid JSON."
+
+# Filled in with str.format per email, so literal braces are doubled
+PROMPT_TEMPLATE = """
     Analyze the following email content and determine if it's related to a user's job application.
 
     The email must be a confirmation, rejection, interview invite, or offer from a company regarding a user's job application.
@@ -52,9 +54,22 @@ def analyze_email(email_content):
     {email_content}
     """
 
+@lru_cache(maxsize=None)
+def get_client():
+    """Create the OpenAI client once so every email reuses its HTTP connections."""
+    # Load environment variables from .env file
+    load_dotenv()
+
+    # Initialize the OpenAI client with the API key
+    return openai.OpenAI(api_key=os.getenv('OPENAI_API_KEY'), timeout=REQUEST_TIMEOUT_SECONDS, max_retries=REQUEST_MAX_RETRIES)
+
+def analyze_email(email_content):
+    client = get_client()
+    prompt = PROMPT_TEMPLATE.format(email_content=email_content)
+
     completion = client.chat.completions.create(
         messages=[
-            {"role": "system", "content": "You are an AI assistant that analyzes emails and extracts job application information. You always and only respond with valid JSON."},
+            {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": prompt}
         ],
         model="gpt-4o-mini",
@@ -1,7 +1,10 @@
 import customtkinter as ctk
 
 class ContentWindow(ctk.CTkToplevel):
-    """A window for displaying and editing job content."""
+    """A window for displaying and editing job content.
+
+    The home screen keeps one instance: closing hides it, and set_job shows it for another job.
+    """
 
     def __init__(self, parent, job_id, content):
         """Initialize the content window."""
@@ -10,6 +13,7 @@ class ContentWindow(ctk.CTkToplevel):
         self.geometry("1200x800")
         self.parent = parent
         self.job_id = job_id
+        self.content = content  # Saved content, so an unchanged save can be skipped
 
         # Configure grid
         self.grid_columnconfigure(0, weight=1)
@@ -43,12 +47,28 @@ class ContentWindow(ctk.CTkToplevel):
         self.save_button = ctk.CTkButton(main_frame, text="Save", command=self.save_content)
         self.save_button.grid(row=2, column=0, padx=10, pady=(0, 10))
 
+    def set_job(self, job_id, content):
+        """Show another job's content. Edits to the current one must be saved first."""
+        self.job_id = job_id
+        self.content = content
+        self.content_text.delete("1.0", ctk.END)
+        self.content_text.insert(ctk.END, content)
+        self.deiconify()
+        self.lift()
+
+    def save_changes(self):
+        """Save the content if it was edited."""
+        new_content = self.content_text.get("1.0", ctk.END).strip()
+        # Saving unchanged content would still write the row and bump its version
+        if new_content != self.content.strip():
+            self.parent.update_job(self.job_id, "content", new_content)
+            self.content = new_content
+
     def save_content(self):
         """Save the updated content and close the window."""
-        new_content = self.content_text.get("1.0", ctk.END).strip()
-        self.parent.update_job(self.job_id, "content", new_content)
+        self.save_changes()
         self.on_closing()
 
     def on_closing(self):
-        """Handle the window closing event."""
-        self.destroy()
\ No newline at end of file
+        """Hide the window so the next job's content can reuse it."""
+        self.withdraw()
\ No newline at end of file
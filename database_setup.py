@@ -23,6 +23,38 @@ def create_table(conn, create_table_sql):
     except Error as e:
         logging.error(f"Error creating table: {e}")
 
+def create_index(conn, create_index_sql):
+    """ Create an index from the create_index_sql statement """
+    try:
+        c = conn.cursor()
+        c.execute(create_index_sql)
+        conn.commit()
+        logging.info("Index created successfully.")
+    except Error as e:
+        logging.error(f"Error creating index: {e}")
+
+def create_trigger(conn, create_trigger_sql):
+    """ Create a trigger from the create_trigger_sql statement """
+    try:
+        c = conn.cursor()
+        c.execute(create_trigger_sql)
+        conn.commit()
+        logging.info("Trigger created successfully.")
+    except Error as e:
+        logging.error(f"Error creating trigger: {e}")
+
+def add_column(conn, table, column, column_definition):
+    """ Add a column to an existing table if it does not have it yet """
+    try:
+        c = conn.cursor()
+        c.execute(f"PRAGMA table_info({table})")
+        if column not in [row[1] for row in c.fetchall()]:
+            c.execute(f"ALTER TABLE {table} ADD COLUMN {column} {column_definition}")
+            conn.commit()
+            logging.info(f"Added column {column} to {table}.")
+    except Error as e:
+        logging.error(f"Error adding column: {e}")
+
 def initialize_database():
     database = "job_applications.db"
 
@@ -36,16 +68,86 @@ def initialize_database():
         last_updated TEXT,
         content TEXT,
         updated INTEGER DEFAULT 0,
-        is_deleted INTEGER DEFAULT 0
+        is_deleted INTEGER DEFAULT 0,
+        last_content_hash BLOB,
+        version INTEGER DEFAULT 0
+    );
+    """
+
+    # Single row counter handing out job versions. Writes to the database are serialized,
+    # so versions increase in commit order and the job list can fetch only newer rows.
+    sql_create_jobs_version_table = """
+    CREATE TABLE IF NOT EXISTS jobs_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
     );
     """
 
+    sql_create_jobs_insert_trigger = """
+    CREATE TRIGGER IF NOT EXISTS jobs_version_after_insert AFTER INSERT ON jobs
+    BEGIN
+        UPDATE jobs_version SET version = version + 1;
+        UPDATE jobs SET version = (SELECT version FROM jobs_version) WHERE id = NEW.id;
+    END;
+    """
+
+    # Only columns shown in the job list bump the version
+    sql_create_jobs_update_trigger = """
+    CREATE TRIGGER IF NOT EXISTS jobs_version_after_update
+    AFTER UPDATE OF company, position, status, application_date, last_updated, updated, is_deleted ON jobs
+    BEGIN
+        UPDATE jobs_version SET version = version + 1;
+        UPDATE jobs SET version = (SELECT version FROM jobs_version) WHERE id = NEW.id;
+    END;
+    """
+
+    # Highest processed IMAP UID per mailbox, only valid for the stored UIDVALIDITY
+    sql_create_meta_table = """
+    CREATE TABLE IF NOT EXISTS meta (
+        mailbox TEXT PRIMARY KEY,
+        uidvalidity INTEGER,
+        last_uid INTEGER DEFAULT 0
+    );
+    """
+
+    # Lets the job list's ORDER BY last_updated DESC walk the index instead of sorting
+    sql_create_last_updated_index = """
+    CREATE INDEX IF NOT EXISTS idx_jobs_last_updated ON jobs (last_updated DESC);
+    """
+
+    # Lets the email watcher find the job an email refers to without scanning the table
+    sql_create_company_position_index = """
+    CREATE INDEX IF NOT EXISTS idx_jobs_company_position ON jobs (company, position);
+    """
+
+    sql_create_version_index = """
+    CREATE INDEX IF NOT EXISTS idx_jobs_version ON jobs (version);
+    """
+
+    # Lets delete_old_entries find old deleted jobs without scanning the table
+    sql_create_deleted_cleanup_index = """
+    CREATE INDEX IF NOT EXISTS idx_jobs_deleted_cleanup ON jobs (is_deleted, last_updated);
+    """
+
     # Create a database connection
     conn = create_connection(database)
 
-    # Create table
+    # Create tables
     if conn is not None:
         create_table(conn, sql_create_jobs_table)
+        create_table(conn, sql_create_meta_table)
+        create_table(conn, sql_create_jobs_version_table)
+        conn.execute("INSERT OR IGNORE INTO jobs_version (id, version) VALUES (1, 0)")
+        conn.commit()
+        # Databases created before the columns existed
+        add_column(conn, "jobs", "last_content_hash", "BLOB")
+        add_column(conn, "jobs", "version", "INTEGER DEFAULT 0")
+        create_index(conn, sql_create_last_updated_index)
+        create_index(conn, sql_create_company_position_index)
+        create_index(conn, sql_create_version_index)
+        create_index(conn, sql_create_deleted_cleanup_index)
+        create_trigger(conn, sql_create_jobs_insert_trigger)
+        create_trigger(conn, sql_create_jobs_update_trigger)
         conn.close()
         logging.info("Database setup successfully.")
     else:
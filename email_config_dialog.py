@@ -1,6 +1,5 @@
 import customtkinter as ctk
 from CTkMessagebox import CTkMessagebox
-import json
 
 class EmailConfigDialog(ctk.CTkToplevel):
     """A dialog window for configuring email settings."""
@@ -70,10 +69,7 @@ class EmailConfigDialog(ctk.CTkToplevel):
                 "inbox": inbox,
                 "imap_server": server
             }
-            with open("email_config.json", "w") as f:
-                json.dump(new_config, f)
-            
-            # Update the parent's configuration and restart the email watcher
+            # Save the configuration through the parent, then restart the email watcher
             self.parent.update_config(new_config)
             
             self.on_closing()
@@ -1,11 +1,28 @@
 import imaplib
 import email
+import base64
+import quopri
+import hashlib
 from email.header import decode_header
 import sqlite3
 import logging
 import backoff
 from analyze_email import analyze_email
 import json
+import re
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# Only the header and the first 16 KiB of the body are needed to classify an email.
+# BODY.PEEK also leaves the \Seen flag untouched.
+FETCH_PARTS = '(BODY.PEEK[HEADER] BODY.PEEK[TEXT]<0.16384>)'
+
+# Returned by process_email for an email that can never be processed, such as one without a
+# Date header or one the model answered with unusable JSON. It is skipped rather than retried.
+UNPROCESSABLE = {"job_related": None}
+
+# A single RFC 2047 encoded word: =?charset?encoding?text?=
+ENCODED_WORD_RE = re.compile(r'=\?([^?]+)\?([bBqQ])\?([^?]*)\?=')
 
 class EmailWatcher:
     """A class for watching and processing job-related emails."""
@@ -20,6 +37,12 @@ class EmailWatcher:
         self.imap_server = imap_server
         self.mail = None
         self.stop_flag = False
+        self.mailbox_key = f"{email_address}:{inbox}"
+        self.uidvalidity = None
+        self.uidnext = None
+        self.last_uid = 0
+        self.saved_uid = 0
+        self.watermark_stopped = False  # Set by the first email a run fails to handle
 
     @backoff.on_exception(backoff.expo, imaplib.IMAP4.error, max_tries=3)
     def connect(self):
@@ -28,42 +51,96 @@ class EmailWatcher:
             self.mail = imaplib.IMAP4_SSL(self.imap_server)
             self.mail.login(self.email_address, self.password)
             self.mail.select(self.inbox)
+            self.load_uid_watermark()
             logging.debug(f"Successfully connected to {self.imap_server}")
             return True
         except imaplib.IMAP4.error as e:
             logging.error(f"Error connecting to {self.imap_server}: {e}")
             return False
 
-    def fetch_new_emails(self, last_checked):
-        """Fetch new emails from the inbox since the last checked time."""
-        emails = []
+    def select_response_number(self, code):
+        """Return a numeric response code, like UIDNEXT, from the last SELECT, or None."""
+        _, data = self.mail.response(code)
+        return int(data[-1]) if data and data[-1] else None
+
+    def load_uid_watermark(self):
+        """Load the highest processed UID, discarding it if the UIDVALIDITY changed. Call right after SELECT."""
+        # STATUS should not be sent for the selected mailbox (RFC 3501 6.3.10) and may return
+        # stale values there, so UIDVALIDITY and UIDNEXT come from the SELECT response
+        self.uidvalidity = self.select_response_number('UIDVALIDITY')
+        self.uidnext = self.select_response_number('UIDNEXT')
+        self.last_uid = 0
+
+        conn = None
         try:
-            self.mail.select(self.inbox)
+            conn = sqlite3.connect("job_applications.db", timeout=10)
+            cursor = conn.cursor()
+            cursor.execute("SELECT uidvalidity, last_uid FROM meta WHERE mailbox = ?", (self.mailbox_key,))
+            row = cursor.fetchone()
+            # UIDs from a different UIDVALIDITY no longer refer to the same messages
+            if row and self.uidvalidity is not None and row[0] == self.uidvalidity:
+                self.last_uid = row[1]
+            self.saved_uid = self.last_uid
+            logging.debug(f"Loaded UID watermark {self.last_uid} for {self.mailbox_key}")
+        except sqlite3.Error as e:
+            logging.error(f"Database error loading UID watermark: {e}")
+        finally:
+            if conn:
+                conn.close()
+
+    def save_uid_watermark(self, cursor):
+        """Record the highest processed UID for this mailbox."""
+        if self.uidvalidity is None:
+            return
+        cursor.execute("""
+            INSERT OR REPLACE INTO meta (mailbox, uidvalidity, last_uid)
+            VALUES (?, ?, ?)
+        """, (self.mailbox_key, self.uidvalidity, self.last_uid))
+        logging.debug(f"Saved UID watermark {self.last_uid} for {self.mailbox_key}")
+
+    def fetch_new_emails(self, last_checked):
+        """Yield emails newer than the UID watermark, or since the last checked time if there is none.
+
+        An email that could not be fetched is yielded as None, so the watermark stops before it.
+        A failed search raises, so run can report the check as failed.
+        """
+        self.mail.select(self.inbox)
+        # UIDNEXT from the SELECT at connect time shows whether anything arrived since the watermark
+        if self.last_uid and self.uidnext is not None and self.uidnext <= self.last_uid + 1:
+            logging.debug("No new emails since the UID watermark")
+            return
+        if self.last_uid:
+            _, search_data = self.mail.uid('search', None, f'UID {self.last_uid + 1}:*')
+            # "n:*" always matches the newest message, even if it is below n
+            email_uids = [uid for uid in search_data[0].split() if int(uid) > self.last_uid]
+        else:
             date_string = last_checked.strftime("%d-%b-%Y")
             _, search_data = self.mail.uid('search', None, f'(SINCE "{date_string}")')
             email_uids = search_data[0].split()
-            
-            for uid in email_uids:
-                try:
-                    _, data = self.mail.uid('fetch', uid, '(RFC822)')
-                    if data and isinstance(data[0], tuple):
-                        raw_email = data[0][1]
-                        email_message = email.message_from_bytes(raw_email)
-                        emails.append((uid, email_message))
-                    else:
-                        logging.warning(f"Unexpected data format for email UID {uid}: {data}")
-                except imaplib.IMAP4.error as e:
-                    logging.error(f"IMAP4 error fetching email UID {uid}: {e}")
-                except Exception as e:
-                    logging.error(f"Unexpected error fetching email UID {uid}: {e}")
-            
-            return emails
-        except imaplib.IMAP4.error as e:
-            logging.error(f"IMAP4 error during fetch: {e}")
-        except Exception as e:
-            logging.error(f"Unexpected error during fetch: {e}")
         
-        return emails  # Return empty list if any error occurred
+        for uid in email_uids:
+            try:
+                _, data = self.mail.uid('fetch', uid, FETCH_PARTS)
+                if data and isinstance(data[0], tuple):
+                    # Join the header and partial text sections back into one message
+                    header, text = b"", b""
+                    for part in data:
+                        if isinstance(part, tuple):
+                            if b"BODY[HEADER]" in part[0]:
+                                header = part[1]
+                            else:
+                                text = part[1]
+                    email_message = email.message_from_bytes(header + text)
+                    yield uid, email_message
+                else:
+                    logging.warning(f"Unexpected data format for email UID {uid}: {data}")
+                    yield uid, None
+            except imaplib.IMAP4.error as e:
+                logging.error(f"IMAP4 error fetching email UID {uid}: {e}")
+                yield uid, None
+            except Exception as e:
+                logging.error(f"Unexpected error fetching email UID {uid}: {e}")
+                yield uid, None
 
     def parse_email(self, email_message):
         """Parse an email message and extract relevant information."""
@@ -89,6 +166,23 @@ class EmailWatcher:
     def decode_header(self, header):
         """Decode email header."""
         try:
+            if isinstance(header, str):
+                # Plain headers need no decoding at all
+                if "=?" not in header:
+                    return header
+                # Decode a lone encoded word directly, leaving anything else to the stdlib parser
+                match = ENCODED_WORD_RE.fullmatch(header.strip())
+                if match:
+                    charset, transfer, text = match.groups()
+                    try:
+                        if transfer in "bB":
+                            raw = base64.b64decode(text)
+                        else:
+                            raw = quopri.decodestring(text, header=True)
+                        return raw.decode(charset, errors="replace")
+                    except (ValueError, LookupError):
+                        pass
+
             decoded_header, encoding = decode_header(header)[0]
             if isinstance(decoded_header, bytes):
                 if encoding is None:
@@ -112,9 +206,11 @@ class EmailWatcher:
             return header
 
     def decode_payload(self, part):
-        """Decode email payload."""
+        """Decode email payload, which may be truncated by the partial fetch."""
         try:
             payload = part.get_payload(decode=True)
+            if payload is None:
+                return ""
             charset = part.get_content_charset() or "utf-8"
             return payload.decode(charset, errors="replace")
         except Exception as e:
@@ -122,7 +218,10 @@ class EmailWatcher:
             return ""
 
     def interpret_email(self, email_data):
-        """Interpret the email content using the ChatGPT parser."""
+        """Interpret the email content using the ChatGPT parser.
+
+        Returns None if the reply is not the expected JSON object. Errors calling the API are raised.
+        """
         email_content = (
             f"Subject: {email_data['subject']}\n\n"
             f"Body: {email_data['body']}"
@@ -133,19 +232,26 @@ class EmailWatcher:
             result = json.loads(parsed_result)
             
             if result['application_status'] is not None:
-                formatted_content = (
+                content_header = (
                     f"From: {email_data['sender']}\n"
                     f"Subject: {email_data['subject']}\n"
                     f"Date: {email_data['date'].strftime('%Y-%m-%d %H:%M:%S')}\n"
+                )
+                formatted_content = (
+                    f"{content_header}"
                     f"{result['email_content']}\n"
                     f"{'-' * 200}\n"
                 )
+                status = result['application_status'] or "Unknown"
+                # The LLM's reformatted body can vary between runs, so only hash the fixed header
+                content_hash = hashlib.sha256((status + content_header).encode()).digest()
                 return {
                     "company": result['company_name'] or "Unknown",
                     "position": result['job_position'] or "Unknown",
-                    "status": result['application_status'] or "Unknown",
-                    "date": email_data["date"].strftime("%Y-%m-%d"),
+                    "status": status,
+                    "date": email_data["date"].date().isoformat(),
                     "content": formatted_content,
+                    "content_hash": content_hash,
                     "job_related": True
                 }
             else:
@@ -155,6 +261,9 @@ class EmailWatcher:
         except json.JSONDecodeError:
             logging.error(f"Error decoding JSON from ChatGPT: {parsed_result}")
             return None
+        except (KeyError, TypeError):
+            logging.error(f"Unexpected JSON from ChatGPT: {parsed_result}")
+            return None
         
     def archive_email(self, email_id):
         """Archive the email by deleting it from the inbox and expunging."""
@@ -167,49 +276,63 @@ class EmailWatcher:
         except Exception as e:
             logging.error(f"Unexpected error archiving email {email_id}: {e}")
 
+    def write_job(self, cursor, job_data):
+        """Insert or update the job an email refers to."""
+        # Check if the job already exists based on company and position
+        cursor.execute("""
+            SELECT id, status, last_content_hash 
+            FROM jobs 
+            WHERE company = ? AND position = ?
+        """, (job_data["company"], job_data["position"]))
+        existing_job = cursor.fetchone()
+
+        if existing_job:
+            job_id, current_status, last_content_hash = existing_job
+            if job_data["content_hash"] == last_content_hash:
+                # Same email as the last update for this job, nothing to write
+                logging.debug(f"Skipped duplicate email for job: {job_data['company']} - {job_data['position']}")
+            elif job_data["status"] != current_status:
+                cursor.execute("""
+                    UPDATE jobs 
+                    SET status = ?, last_updated = ?, content = content || '\n\n' || ?, updated = 1, last_content_hash = ?
+                    WHERE id = ?
+                """, (job_data["status"], job_data["date"], job_data["content"], job_data["content_hash"], job_id))
+                logging.debug(f"Updated existing job: {job_data['company']} - {job_data['position']}")
+            else:
+                cursor.execute("""
+                    UPDATE jobs 
+                    SET last_updated = ?, content = content || '\n\n' || ?, last_content_hash = ?
+                    WHERE id = ?
+                """, (job_data["date"], job_data["content"], job_data["content_hash"], job_id))
+                logging.debug(f"Updated existing job: {job_data['company']} - {job_data['position']}")
+        else:
+            # Insert new job
+            cursor.execute("""
+                INSERT INTO jobs (company, position, status, application_date, last_updated, content, updated, last_content_hash) 
+                VALUES (?, ?, ?, ?, ?, ?, 1, ?)
+            """, (job_data["company"], job_data["position"], job_data["status"], job_data["date"], 
+                  job_data["date"], job_data["content"], job_data["content_hash"]))
+            logging.debug(f"Inserted new job: {job_data['company']} - {job_data['position']}")
+
     @backoff.on_exception(backoff.expo, sqlite3.Error, max_tries=3)
-    def update_database(self, job_data):
-        """Update the job application database with extracted information."""
+    def update_database(self, jobs):
+        """Write every job update from one run, and the new UID watermark, in a single transaction."""
+        conn = None
         try:
             conn = sqlite3.connect("job_applications.db", timeout=10)
+            # synchronous is per connection; NORMAL is safe in WAL mode and avoids an fsync on every commit
+            conn.execute("PRAGMA synchronous=NORMAL")
             cursor = conn.cursor()
+            # Take the write lock up front. A transaction that starts with a read can fail with
+            # SQLITE_BUSY when it later tries to write after the home screen has committed.
+            cursor.execute("BEGIN IMMEDIATE")
 
-            # Check if the job already exists based on company and position
-            cursor.execute("""
-                SELECT id, status 
-                FROM jobs 
-                WHERE company = ? AND position = ?
-            """, (job_data["company"], job_data["position"]))
-            existing_job = cursor.fetchone()
-
-            if existing_job:
-                job_id, current_status = existing_job
-                if job_data["status"] != current_status:
-                    cursor.execute("""
-                        UPDATE jobs 
-                        SET status = ?, last_updated = ?, content = content || '\n\n' || ?, updated = 1
-                        WHERE id = ?
-                    """, (job_data["status"], job_data["date"], job_data["content"], job_id))
-                else:
-                    cursor.execute("""
-                        UPDATE jobs 
-                        SET last_updated = ?, content = content || '\n\n' || ?
-                        WHERE id = ?
-                    """, (job_data["date"], job_data["content"], job_id))
-                
-                logging.debug(f"Updated existing job: {job_data['company']} - {job_data['position']}")
-            else:
-                # Insert new job
-                cursor.execute("""
-                    INSERT INTO jobs (company, position, status, application_date, last_updated, content, updated) 
-                    VALUES (?, ?, ?, ?, ?, ?, 1)
-                """, (job_data["company"], job_data["position"], job_data["status"], job_data["date"], 
-                      job_data["date"], job_data["content"]))
-                job_id = cursor.lastrowid
-                logging.debug(f"Inserted new job: {job_data['company']} - {job_data['position']}")
+            for job_data in jobs:
+                self.write_job(cursor, job_data)
+            self.save_uid_watermark(cursor)
 
             conn.commit()
-            logging.debug(f"Database updated for job: {job_data['company']} - {job_data['position']}")
+            logging.debug(f"Database updated for {len(jobs)} job-related emails")
         except sqlite3.Error as e:
             logging.error(f"Database error: {e}")
             if conn:
@@ -220,7 +343,13 @@ class EmailWatcher:
                 conn.close()
 
     def process_email(self, uid, email_message):
-        """Process a single email message."""
+        """Process a single email message.
+
+        Returns None after a failure worth retrying, like a fetch or API error, and
+        UNPROCESSABLE for an email that would fail the same way every time.
+        """
+        if email_message is None:
+            return None
         try:
             email_data = self.parse_email(email_message)
             if email_data:
@@ -233,42 +362,84 @@ class EmailWatcher:
                 logging.warning(f"Failed to parse email UID {uid}")
         except Exception as e:
             logging.error(f"Error processing email UID {uid}: {e}")
-        
-        return None
+            return None
+
+        return UNPROCESSABLE
+
+    def handle_processed_email(self, uid, job_data, jobs):
+        """Queue a job-related email's update, or archive an email that is not job-related."""
+        handled = False
+        if job_data is UNPROCESSABLE:
+            # Left in the inbox, but the watermark moves past it so later emails are not held up
+            handled = True
+            logging.warning(f"Skipping email UID {uid}, which cannot be processed")
+        elif job_data:
+            if job_data["job_related"]:
+                # If job-related, queue the database update but don't archive
+                jobs.append(job_data)
+                handled = True
+                logging.debug(f"Processed job-related email UID {uid}")
+            else:
+                # If not job-related, archive the email
+                try:
+                    self.mail.uid('store', uid, '+FLAGS', '\\Deleted')
+                    handled = True
+                    logging.debug(f"Not job-related. Archived email UID {uid}")
+                except imaplib.IMAP4.error as e:
+                    logging.error(f"Error archiving email UID {uid}: {e}")
+        else:
+            logging.warning(f"Failed to process email UID {uid}")
+
+        # The watermark stops at the first unhandled email, so it is fetched again next run
+        if not handled:
+            self.watermark_stopped = True
+        elif not self.watermark_stopped:
+            self.last_uid = max(self.last_uid, int(uid))
 
-    def run(self, last_checked):
-        """Main method to run the email watcher."""
+    def run(self, last_checked, workers=1):
+        """Main method to run the email watcher, analyzing up to `workers` emails at once.
+
+        Returns whether the check completed. Emails that failed on their own are retried by the next run.
+        """
         try:
             if self.connect():
                 logging.debug(f"Fetching all new emails since {last_checked}")
-                emails = self.fetch_new_emails(last_checked)
-                
-                for uid, email_message in emails:
-                    if self.stop_flag:
-                        break
-                    logging.debug(f"Processing email UID {uid}")
-                    
-                    # Process the email and get the result
-                    job_data = self.process_email(uid, email_message)
-                    
-                    if job_data:
-                        if job_data["job_related"]:
-                            # If job-related, update the database but don't archive
-                            self.update_database(job_data)
-                            logging.debug(f"Processed job-related email UID {uid}")
-                        else:
-                            # If not job-related, archive the email
-                            try:
-                                self.mail.uid('store', uid, '+FLAGS', '\\Deleted')
-                                logging.debug(f"Not job-related. Archived email UID {uid}")
-                            except imaplib.IMAP4.error as e:
-                                logging.error(f"Error archiving email UID {uid}: {e}")
-                    else:
-                        logging.warning(f"Failed to process email UID {uid}")
-                
+                # Job updates are collected and written together once all emails are processed
+                jobs = []
+                # Analysis waits on the OpenAI API, so several emails are analyzed at once. All IMAP
+                # commands stay on this thread, and results are handled in UID order so the
+                # watermark never skips an unhandled email.
+                self.watermark_stopped = False
+                in_flight = deque()
+                executor = ThreadPoolExecutor(max_workers=workers)
+                try:
+                    # Emails are fetched one at a time as the loop consumes them
+                    for uid, email_message in self.fetch_new_emails(last_checked):
+                        if self.stop_flag:
+                            break
+                        logging.debug(f"Processing email UID {uid}")
+                        in_flight.append((uid, executor.submit(self.process_email, uid, email_message)))
+                        if len(in_flight) >= workers:
+                            uid, future = in_flight.popleft()
+                            self.handle_processed_email(uid, future.result(), jobs)
+
+                    # Finish the emails still being analyzed, unless the watcher is being stopped
+                    for uid, future in in_flight:
+                        if self.stop_flag:
+                            break
+                        self.handle_processed_email(uid, future.result(), jobs)
+                finally:
+                    # A stopping run does not wait for the analyses it no longer needs
+                    executor.shutdown(wait=not self.stop_flag, cancel_futures=True)
+
+                # Most checks find nothing new, so skip the write transaction entirely
+                if jobs or self.last_uid != self.saved_uid:
+                    self.update_database(jobs)
+
                 # Expunge deleted messages
                 self.mail.expunge()
                 logging.debug("Finished processing emails")
+                return True
         except imaplib.IMAP4.error as e:
             logging.error(f"IMAP4 error: {e}")
         except ConnectionError as e:
@@ -281,4 +452,5 @@ class EmailWatcher:
                     self.mail.logout()
                     logging.debug("Successfully logged out from email server")
                 except Exception as e:
-                    logging.error(f"Error during logout: {e}")
\ No newline at end of file
+                    logging.error(f"Error during logout: {e}")
+        return False
\ No newline at end of file
@@ -1,12 +1,18 @@
 import logging
-import time
 import customtkinter as ctk
 import sqlite3
 from CTkMessagebox import CTkMessagebox
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 import threading
+import queue
+from contextlib import contextmanager
+from concurrent.futures import Future, wait
 import json
 import os
+import re
+import heapq
+from dataclasses import dataclass
+from functools import partial
 from email_watcher import EmailWatcher
 from content_window import ContentWindow
 from email_config_dialog import EmailConfigDialog
@@ -18,6 +24,79 @@ logging.getLogger("openai").setLevel(logging.WARNING)
 logging.getLogger("httpx").setLevel(logging.WARNING)
 logging.getLogger("httpcore").setLevel(logging.WARNING)
 
+# One fixed statement per editable column, so SQLite's statement cache can reuse them
+EDITABLE_FIELDS = ("company", "position", "status", "application_date", "content")
+UPDATE_SQL = {field: f"UPDATE jobs SET {field} = ?, last_updated = ? WHERE id = ?" for field in EDITABLE_FIELDS}
+
+# Application dates are entered as YYYY-MM-DD
+DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
+# Choices in each row's status dropdown, and the dropdown color for each
+STATUS_VALUES = ("Applied", "Interview", "Offer", "Rejected")
+STATUS_COLORS = {"Applied": "blue", "Interview": "orange", "Offer": "green", "Rejected": "red"}
+
+# First retry delay after a failed email check, doubled on each further failure
+RETRY_DELAY_SECONDS = 60
+
+# Delay before an edited field is saved, so repeated focus changes on it end in one write
+SAVE_DELAY_MS = 250
+
+# Read-only connections in the reader pool; the Tk thread and the email watcher thread both read
+READER_CONNECTIONS = 2
+
+# Number of job rows created per event loop pass when filling in the job list
+ROW_BATCH_SIZE = 25
+
+# Most removed job rows whose widgets are kept hidden for reuse by later jobs
+ROW_POOL_SIZE = 200
+
+# Row fields compared by apply_refresh, in the order they are stored in a row's snapshot
+REFRESH_FIELDS = ("company", "position", "status", "application_date", "last_updated", "updated")
+
+@dataclass(slots=True)
+class JobRow:
+    """The widgets and cached values of one job row on the home screen."""
+    row: int
+    update_indicator: ctk.CTkLabel | None  # Created the first time the job is marked as updated
+    company: ctk.CTkEntry
+    position: ctk.CTkEntry
+    status: ctk.CTkOptionMenu
+    application_date: ctk.CTkEntry
+    last_updated: ctk.CTkLabel
+    content: ctk.CTkButton
+    delete: ctk.CTkButton
+    # Last saved values, used to restore a widget after a failed validation
+    company_value: str
+    position_value: str
+    status_value: str
+    application_date_value: str
+    # Values as of the last refresh, in REFRESH_FIELDS order
+    snapshot: tuple
+
+    def widgets(self):
+        """Return the row's widgets that exist."""
+        return [widget for widget in (self.update_indicator, self.company, self.position, self.status,
+                                      self.application_date, self.last_updated, self.content, self.delete)
+                if widget is not None]
+
+def today():
+    """Return today's date as stored in the jobs table (YYYY-MM-DD)."""
+    # isoformat skips the format string parsing strftime does on every call
+    return date.today().isoformat()
+
+def write_json_atomic(path, data, fsync=True):
+    """Write data as JSON to path so a crash mid-write never leaves a truncated file.
+
+    fsync=False still protects against the app crashing, but not against a power loss.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+        if fsync:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(temp_path, path)
+
 class HomeScreen(ctk.CTk):
     """The main application window for the job tracker."""
 
@@ -37,9 +116,14 @@ class HomeScreen(ctk.CTk):
         # Set up logging
         self.setup_logging()
 
-        # Create database if it does not exist
-        if not os.path.exists("job_applications.db"):
-            initialize_database()
+        # Create database tables if they do not exist
+        initialize_database()
+
+        # Open the database connection shared by the whole app
+        self.open_database()
+
+        # Last sync time, read from last_checked.json on first use
+        self.last_checked = None
 
         # Purge deleted jobs from the database
         self.delete_old_entries()
@@ -55,11 +139,39 @@ class HomeScreen(ctk.CTk):
         # Load user preferences
         self.load_preferences()
 
-        # Initialize variables
-        self.job_rows = {}  # Dictionary to store job rows by job ID
+        # Initialize variables. The row state is only touched on the Tk thread; the email
+        # watcher thread hands job lists over through queue_refresh instead.
+        self.job_rows = {}  # JobRow for each job on screen, by job ID
         self.next_row = 1  # Start job rows from row 1 (after headers)
+        self.free_rows = []  # Heap of grid rows left empty by removed jobs
+        self.row_pool = []  # Heap of (grid row, JobRow) for removed jobs whose widgets are hidden
+        self.pending_jobs = {}  # Jobs waiting for their rows to be created, by job ID
+        self.pending_rows_scheduled = False
+        self.pending_writes = {}  # (after ID, value) of each debounced field save, by (job ID, field)
+        # Widget updater for each field, called as updater(job_id, job_row, value) by update_job_row
+        self.row_updaters = {
+            "company": partial(self.update_entry_field, "company"),
+            "position": partial(self.update_entry_field, "position"),
+            "application_date": partial(self.update_entry_field, "application_date"),
+            "status": self.update_status_field,
+            "last_updated": self.update_last_updated_field,
+            "updated": self.update_updated_field,
+            # Content is shown in a separate window, so there is no widget to update
+            "content": lambda job_id, job_row, value: None,
+        }
+        self.jobs_version = -1  # Highest job version shown, so refreshes only read newer changes
+        self.pending_refresh = None  # Latest job list from the watcher thread, not yet shown
+        self.refresh_lock = threading.Lock()
         self.email_watcher = None
-        self.email_watcher_thread = None
+        self.email_watcher_future = None
+        self.stop_event = None
+        self.check_event = None  # Set to make the email watcher check now instead of waiting
+        self.content_window = None  # Created on first use, then hidden and reused
+        # One long-lived worker runs the email watcher, so restarts do not spawn new threads.
+        # It is a daemon thread, like the watcher thread it replaced, so closing the window
+        # never waits for a check that is still running.
+        self.email_runs = queue.Queue()
+        threading.Thread(target=self.email_worker, name="email", daemon=True).start()
 
         # Set up UI components
         logging.info("Setting up UI components.")
@@ -68,6 +180,9 @@ class HomeScreen(ctk.CTk):
         self.setup_jobs_frame()
         self.setup_preferences_frame()
 
+        # Show the stored jobs right away instead of waiting for the first email check
+        self.apply_refresh(self.fetch_jobs())
+
         # Load email configuration
         self.config = self.load_config()
         if self.config == {}:
@@ -78,28 +193,76 @@ class HomeScreen(ctk.CTk):
             logging.info("Starting email watcher.")
             self.start_email_watcher()
 
+        # Set up window close protocol
+        self.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+    def open_database(self):
+        """Open one long-lived database connection instead of connecting for every query."""
+        # The email watcher thread also triggers refreshes, so access is serialized with a lock
+        self.conn = sqlite3.connect("job_applications.db", check_same_thread=False)
+        self.conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-8000;
+            PRAGMA busy_timeout=5000;
+        """)
+        self.db_lock = threading.Lock()
+
+        # Reads borrow a read-only connection from a pool, so under WAL a refresh never waits
+        # behind a write and the two threads' reads do not wait for each other
+        self.readers = queue.Queue()
+        self.readers_closed = False
+        self.readers_lock = threading.Lock()  # Orders returning a reader against closing the pool
+        for _ in range(READER_CONNECTIONS):
+            self.readers.put(sqlite3.connect("file:job_applications.db?mode=ro", uri=True, check_same_thread=False))
+
+    @contextmanager
+    def reader(self):
+        """Borrow a read-only database connection from the pool."""
+        conn = self.readers.get()
+        # on_closing leaves None in the emptied pool, so late readers fail instead of waiting forever
+        if conn is None:
+            self.readers.put(None)
+            raise sqlite3.ProgrammingError("Cannot read from a closed database.")
+        try:
+            yield conn
+        finally:
+            # A reader borrowed while the pool was being closed is closed instead of returned
+            with self.readers_lock:
+                if self.readers_closed:
+                    conn.close()
+                else:
+                    self.readers.put(conn)
+
+    def on_closing(self):
+        """Stop the email watcher and close the database before exiting."""
+        self.flush_pending_writes()
+        self.stop_email_watcher()
+        with self.readers_lock:
+            self.readers_closed = True
+            while not self.readers.empty():
+                self.readers.get_nowait().close()
+            self.readers.put(None)
+        self.conn.close()
+        self.destroy()
+
     def delete_old_entries(self):
         """Delete entries marked as deleted that are older than last_checked_date - 1 day so they are not readded"""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
-
         # Get the last checked date
         last_checked = self.load_sync_time()
         cutoff_date = last_checked.strftime("%Y-%m-%d")
 
         try:
-            cursor.execute("""
-                DELETE FROM jobs 
-                WHERE is_deleted = 1 AND last_updated < ?
-            """, (cutoff_date,))
+            with self.db_lock, self.conn:
+                cursor = self.conn.execute("""
+                    DELETE FROM jobs 
+                    WHERE is_deleted = 1 AND last_updated < ?
+                """, (cutoff_date,))
             deleted_count = cursor.rowcount
-            conn.commit()
             logging.info(f"Deleted {deleted_count} old entries marked for deletion.")
         except sqlite3.Error as e:
             logging.error(f"An error occurred while deleting old entries: {e}")
-            conn.rollback()
-        finally:
-            conn.close()
 
     def load_preferences(self):
         """Load user preferences from a JSON file."""
@@ -107,13 +270,12 @@ class HomeScreen(ctk.CTk):
             with open("user_preferences.json", "r") as f:
                 self.preferences = json.load(f)
         except FileNotFoundError:
-            self.preferences = {"auto_check_interval": 1}
+            self.preferences = {"auto_check_interval": 1, "email_workers": 4}
             self.save_preferences()
     
     def save_preferences(self):
         """Save user preferences to a JSON file."""
-        with open("user_preferences.json", "w") as f:
-            json.dump(self.preferences, f)
+        write_json_atomic("user_preferences.json", self.preferences)
 
     def setup_preferences_frame(self):
         """Set up the preferences frame."""
@@ -214,8 +376,10 @@ class HomeScreen(ctk.CTk):
         self.last_sync_label.configure(text=f"Last sync: {current_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         # Save the current time to a file
-        with open('last_checked.json', 'w') as f:
-            json.dump({'last_checked': current_time.isoformat()}, f)
+        # Skip the fsync: this runs on the Tk thread after every refresh, and the UID watermark
+        # in the database, not this time, decides which emails are fetched once it exists
+        write_json_atomic('last_checked.json', {'last_checked': current_time.isoformat()}, fsync=False)
+        self.last_checked = current_time
         
         logging.info(f"Last sync time updated to {current_time}")
 
@@ -236,8 +400,11 @@ class HomeScreen(ctk.CTk):
 
         headers = ["Company","Position","Status","Application Date","Last Updated","",""]
         # Create header labels 
+        header_font = ctk.CTkFont(size=16, weight="bold")
+        # Shared by every row's update indicator, so each one does not resolve its own font
+        self.indicator_font = ctk.CTkFont(family="Arial", size=28, weight="bold")
         for i, header in enumerate(headers):
-            label = ctk.CTkLabel(self.jobs_frame, text=header, font=ctk.CTkFont(size=16, weight="bold"))
+            label = ctk.CTkLabel(self.jobs_frame, text=header, font=header_font)
             label.grid(row=0, column=i, padx=5, pady=(5, 10), sticky="ew")
             # Center text for all columns except content and Delete
             if i < 5:  
@@ -245,22 +412,24 @@ class HomeScreen(ctk.CTk):
 
     def refresh_emails_and_jobs(self):
         """Manually refresh emails and update the job list."""
-        if self.email_watcher:
-            try:
-                # Get the last checked time
-                last_checked = self.load_sync_time()
-                self.email_watcher.run(last_checked)
-                self.refresh_jobs()
-                self.status_indicator.configure(text_color="green")
-                CTkMessagebox(title="Success", message="Emails checked and jobs refreshed!", icon="info")
-            except Exception as e:
-                logging.error(f"An error occurred while refreshing emails: {e}")
-                self.status_indicator.configure(text_color="red")
-                CTkMessagebox(title="Error", message=f"Failed to refresh emails: {str(e)}. Please try again.", icon="cancel")
+        if self.email_watcher and self.email_watcher_future and not self.email_watcher_future.done():
+            # The check runs on the watcher's worker, which owns the IMAP connection, so the
+            # window stays responsive. manual_check_finished reports the result.
+            self.check_event.set()
+        elif self.email_watcher:
+            self.status_indicator.configure(text_color="red")
+            CTkMessagebox(title="Error", message="Failed to refresh emails: the email watcher is not connected. Please try again.", icon="cancel")
         else:
             self.status_indicator.configure(text_color="red")
             CTkMessagebox(title="Error", message="Email watcher not configured. Please set up email configuration first.", icon="cancel")
 
+    def manual_check_finished(self, error):
+        """Report the result of an email check requested with the refresh button."""
+        if error is None:
+            CTkMessagebox(title="Success", message="Emails checked and jobs refreshed!", icon="info")
+        else:
+            CTkMessagebox(title="Error", message=f"Failed to refresh emails: {str(error)}. Please try again.", icon="cancel")
+
     def load_config(self):
         """Load the email configuration from the config file."""
         try:
@@ -277,8 +446,10 @@ class HomeScreen(ctk.CTk):
         return config
 
     def update_config(self, new_config):
-        """Update the email configuration and restart the email watcher."""
+        """Save the email configuration and restart the email watcher."""
         logging.info("Updating email configuration.")
+        # The watcher is started from the new dict, so the file is not read back
+        write_json_atomic("email_config.json", new_config)
         self.config = new_config
         if self.email_watcher:
             self.stop_email_watcher()
@@ -298,69 +469,120 @@ class HomeScreen(ctk.CTk):
         # Create the email watcher object
         self.email_watcher = EmailWatcher(self.config["email"], self.config["password"], self.config["inbox"], self.config["imap_server"])
 
-        # Test connection before starting the thread
+        # Each watcher run gets its own event so a restart cannot revive a stopping run.
+        # The connection is tested on the worker, so logging in does not hold up the window.
+        self.stop_event = threading.Event()
+        self.check_event = threading.Event()
+        self.email_watcher_future = Future()
+        self.email_runs.put((self.email_watcher_future, (self.email_watcher, self.stop_event, self.check_event)))
+
+    def email_worker(self):
+        """Run queued email watcher runs one at a time, for the life of the app."""
+        while True:
+            future, args = self.email_runs.get()
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(self.run_email_watcher(*args))
+                except BaseException as e:
+                    future.set_exception(e)
+
+    def email_watcher_connection_failed(self):
+        """Report that the email watcher could not connect to the email server."""
+        self.status_indicator.configure(text_color="red")
+        CTkMessagebox(title="Error",message="Failed to connect to email server. Please check your credentials and try again.",icon="cancel")
+        logging.error("Failed to connect to email server. Email watcher not started.")
+
+    def run_email_watcher(self, email_watcher, stop_event, check_event):
+        """Test the email connection, then run the email watcher until stop_event is set.
+
+        Setting check_event starts the next check right away.
+        """
         logging.info("Testing email watcher connection.")
-        if self.email_watcher.connect():
-            self.email_watcher_thread = threading.Thread(target=self.run_email_watcher, daemon=True)
-            self.email_watcher_thread.start()
-            self.status_indicator.configure(text_color="green")
-        else:
-            self.status_indicator.configure(text_color="red")
-            CTkMessagebox(title="Error",message="Failed to connect to email server. Please check your credentials and try again.",icon="cancel")
-            logging.error("Failed to connect to email server. Email watcher not started.")
-
-    def run_email_watcher(self):
-        """Run the email watcher continuously."""
-        while not getattr(self.email_watcher, "stop_flag", False):
+        try:
+            connected = email_watcher.connect()
+        except Exception as e:
+            logging.error(f"An error occurred while connecting: {e}")
+            connected = False
+        if not connected:
+            self.after(0, self.email_watcher_connection_failed)
+            return
+        self.after(0, lambda: self.status_indicator.configure(text_color="green"))
+
+        # Seconds
+        interval = self.preferences["auto_check_interval"] * 3600
+        retry_delay = RETRY_DELAY_SECONDS
+        while not stop_event.is_set():
+            # A check requested while the previous one was running gets a run of its own
+            manual = check_event.is_set()
+            check_event.clear()
             try:
                 logging.info("Running email watcher")
                 last_checked = self.load_sync_time()
-                self.email_watcher.run(last_checked)
-                self.after(0, self.refresh_jobs)
-                self.after(0, self.status_indicator.configure(text_color="green"))
+                # run logs its own errors and only reports whether the check completed
+                if not email_watcher.run(last_checked, self.preferences.get("email_workers", 4)):
+                    raise RuntimeError("the email check did not complete")
+                # The window may have closed during the check, along with the database
+                if stop_event.is_set():
+                    break
+                # Read the jobs here so the Tk thread only has to update widgets
+                self.queue_refresh(self.fetch_jobs())
+                self.after(0, lambda: self.status_indicator.configure(text_color="green"))
+                retry_delay = RETRY_DELAY_SECONDS
+                delay = interval
+                if manual:
+                    self.after(0, self.manual_check_finished, None)
             except Exception as e:
                 logging.error(f"An error occurred: {e}")
-                self.after(0, self.status_indicator.configure(text_color="red"))
-            finally:
-                 # Seconds
-                 time.sleep(self.preferences["auto_check_interval"] * 3600)
+                self.after(0, lambda: self.status_indicator.configure(text_color="red"))
+                if manual:
+                    self.after(0, self.manual_check_finished, e)
+                # Retry sooner than the normal interval, backing off on repeated failures
+                delay = min(retry_delay, interval)
+                retry_delay *= 2
+            # Returns early as soon as the watcher is stopped or a check is requested
+            check_event.wait(delay)
         
     def load_sync_time(self):
-        """Get the last checked time from the file."""
+        """Get the last checked time, reading the file only the first time."""
+        # Only this app writes the file, and update_sync_time keeps the cached copy current
+        if self.last_checked is not None:
+            return self.last_checked
         try:
             with open('last_checked.json', 'r') as f:
                 data = json.load(f)
-                return datetime.fromisoformat(data['last_checked'])
+                self.last_checked = datetime.fromisoformat(data['last_checked'])
+                return self.last_checked
         except (FileNotFoundError, json.JSONDecodeError):
             # Default to 7 day ago if no last checked time is found or if there's an error
             return datetime.now() - timedelta(days=7)
 
     def stop_email_watcher(self):
-        """Stop the current email watcher thread."""
-        if (self.email_watcher and self.email_watcher_thread and self.email_watcher_thread.is_alive()):
+        """Stop the current email watcher run."""
+        if (self.email_watcher and self.email_watcher_future and not self.email_watcher_future.done()):
             self.email_watcher.stop_flag = True
-            # Wait for the thread to finish
-            self.email_watcher_thread.join(timeout=5)  
+            self.stop_event.set()
+            self.check_event.set()
+            # Wait for the run to finish. A new run submitted meanwhile queues behind it.
+            wait([self.email_watcher_future], timeout=2)
         self.email_watcher = None
-        self.email_watcher_thread = None
+        self.email_watcher_future = None
+        self.stop_event = None
+        self.check_event = None
 
     def add_new_job(self):
         """Add a new job entry to the database and UI."""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
-        current_date = datetime.now().strftime("%Y-%m-%d")
+        current_date = today()
         
-        cursor.execute(
-            """INSERT INTO jobs (company, position, status, application_date, last_updated, content, updated, is_deleted) 
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            ("New Company", "New Position", "Applied", current_date, current_date, "", 0, 0)
-        )
+        with self.db_lock, self.conn:
+            cursor = self.conn.execute(
+                """INSERT INTO jobs (company, position, status, application_date, last_updated, content, updated, is_deleted) 
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+                ("New Company", "New Position", "Applied", current_date, current_date, "", 0, 0)
+            )
 
         job_id = cursor.lastrowid
-        conn.commit()
-        conn.close()
 
-        self.add_job_row(job_id, "New Company", "New Position", "Applied", current_date, current_date, "")
+        self.add_job_row(job_id, "New Company", "New Position", "Applied", current_date, current_date, 0)
         logging.info(f"Added new job with ID {job_id}")
 
     def delete_job(self, job_id):
@@ -368,143 +590,242 @@ class HomeScreen(ctk.CTk):
         confirm = CTkMessagebox(title="Confirm Deletion", message="Are you sure you want to delete this job?", icon="question", option_1="Yes", option_2="No")
 
         if confirm.get() == "Yes":
-            conn = sqlite3.connect("job_applications.db")
-            cursor = conn.cursor()
-
             try:
                 # Mark the job as deleted in the database
-                cursor.execute("UPDATE jobs SET is_deleted = 1 WHERE id = ?", (job_id,))
-                conn.commit()
+                with self.db_lock, self.conn:
+                    self.conn.execute("UPDATE jobs SET is_deleted = 1 WHERE id = ?", (job_id,))
                 
                 # Remove the job row from the UI
                 self.remove_job_row(job_id)
                 logging.info(f"Marked job with ID {job_id} as deleted and removed from UI")
             except sqlite3.Error as e:
                 logging.error(f"Database error when deleting job {job_id}: {e}")
-                conn.rollback()
-            finally:
-                conn.close()
 
     def validate_and_update(self, job_id, field, value, widget):
         """Validate user input and update the job if valid."""
+        # The row was removed while its entry had focus; a pooled entry still names the old job
+        if job_id not in self.job_rows:
+            return
+
+        # Focus leaving a field whose value is already waiting to be saved
+        pending = self.pending_writes.get((job_id, field))
+        if pending is not None and value == pending[1]:
+            return
+
+        # Focus leaving a field the user did not change, or changed back before its save ran
+        if value == getattr(self.job_rows[job_id], field + "_value", None):
+            self.cancel_pending_write(job_id, field)
+            return
+
         error = None
         if field in ["company", "position"] and not value.strip():
             error = f"{field.capitalize()} cannot be empty."
         elif field == "application_date":
-            try:
-                datetime.strptime(value, "%Y-%m-%d")
-            except ValueError:
+            # The regex pins the format, since fromisoformat also accepts forms like 20240101.
+            # fromisoformat then rejects impossible days like 2024-02-30.
+            if not DATE_RE.match(value):
                 error = "Invalid date. Please use YYYY-MM-DD format."
+            else:
+                try:
+                    date.fromisoformat(value)
+                except ValueError:
+                    error = "Invalid date. Please use YYYY-MM-DD format."
 
         if error:
+            # The entry goes back to the saved value, so a save still waiting would undo that
+            self.cancel_pending_write(job_id, field)
             CTkMessagebox(title="Validation Error", message=error, icon="cancel")
             widget.delete(0, ctk.END)
             widget.insert(0, self.get_original_value(job_id, field))
         else:
+            self.schedule_update(job_id, field, value)
+
+    def schedule_update(self, job_id, field, value):
+        """Save a field after SAVE_DELAY_MS, replacing any save of it still waiting."""
+        self.cancel_pending_write(job_id, field)
+        self.pending_writes[(job_id, field)] = (self.after(SAVE_DELAY_MS, self.run_pending_write, job_id, field), value)
+
+    def cancel_pending_write(self, job_id, field):
+        """Drop a field's debounced save, if one is waiting."""
+        pending = self.pending_writes.pop((job_id, field), None)
+        if pending is not None:
+            self.after_cancel(pending[0])
+
+    def run_pending_write(self, job_id, field):
+        """Save a debounced field edit."""
+        _, value = self.pending_writes.pop((job_id, field))
+        # The job may have been deleted while the save was waiting
+        if job_id in self.job_rows:
             self.update_job(job_id, field, value)
 
+    def flush_pending_writes(self):
+        """Save every debounced field edit now instead of waiting for its timer."""
+        for job_id, field in list(self.pending_writes):
+            self.after_cancel(self.pending_writes[(job_id, field)][0])
+            self.run_pending_write(job_id, field)
+
     def get_original_value(self, job_id, field):
-        """Retrieve the original value of a field from the database."""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
-        cursor.execute(f"SELECT {field} FROM jobs WHERE id = ?", (job_id,))
-        value = cursor.fetchone()[0]
-        conn.close()
-        return value
+        """Retrieve the last saved value of a field from the job row cache."""
+        return getattr(self.job_rows[job_id], field + "_value")
 
     def update_job(self, job_id, field, value):
         """Update a job field in the database and UI."""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
+        # Column names cannot be bound as parameters, so only known fields are accepted
+        if field not in UPDATE_SQL:
+            raise ValueError(f"Unknown job field: {field}")
+
+        # Skip the write and last_updated bump when the value is already saved. The job's row
+        # may be gone, e.g. when the reused content window saves edits to a deleted job.
+        if value == getattr(self.job_rows.get(job_id), field + "_value", None):
+            return
+
         try:
-            current_date = datetime.now().strftime("%Y-%m-%d")
+            current_date = today()
             
-            cursor.execute(f"UPDATE jobs SET {field} = ?, last_updated = ? WHERE id = ?", (value, current_date, job_id))
+            with self.db_lock, self.conn:
+                self.conn.execute(UPDATE_SQL[field], (value, current_date, job_id))
             
-            conn.commit()
             self.update_job_row(job_id, field, value)
             if field != "content":
                 self.update_job_row(job_id, "last_updated", current_date)
             if field == "status":
-                self.update_status_color(self.job_rows[job_id]["status"], value)
+                self.update_status_color(self.job_rows[job_id].status, value)
             logging.info(f"Updated job {job_id} field {field} to {value}")
         except sqlite3.Error as e:
             logging.error(f"An error occurred while updating the job: {e}")
             CTkMessagebox(title="Database Error", message="An error occurred while updating the job.", icon="cancel")
-        finally:
-            conn.close()
 
-    def open_content(self, job_id, content):
-        """Open the content window for a specific job."""
-        ContentWindow(self, job_id, content)
-
-    def refresh_jobs(self):
-        """Refresh the job list from the database, excluding deleted jobs."""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
-        cursor.execute("SELECT id, company, position, status, application_date, last_updated, content, updated FROM jobs WHERE is_deleted = 0 ORDER BY last_updated DESC")
-        jobs = cursor.fetchall()
-        conn.close()
+    def open_content(self, job_id):
+        """Load a job's content and open the content window for it."""
+        # Save edits still open in the content window first, so the content read below includes
+        # them when the same job is opened again
+        if self.content_window is not None and self.content_window.state() != "withdrawn":
+            self.content_window.save_changes()
+
+        # Content can be large, so it is only read when the window is opened
+        with self.reader() as conn:
+            content = conn.execute("SELECT content FROM jobs WHERE id = ?", (job_id,)).fetchone()[0]
+        # Building a Toplevel and its textbox is slow, so one window is reused for every job
+        if self.content_window is None:
+            self.content_window = ContentWindow(self, job_id, content or "")
+        else:
+            self.content_window.set_job(job_id, content or "")
+
+    def fetch_jobs(self):
+        """Read the jobs changed since the last applied refresh. Safe to call from any thread."""
+        # Deleted jobs are included so their rows can be removed
+        with self.reader() as conn:
+            return conn.execute("""
+                SELECT id, company, position, status, application_date, last_updated, updated, is_deleted, version
+                FROM jobs INDEXED BY idx_jobs_version
+                WHERE version > ?
+                ORDER BY last_updated DESC
+            """, (self.jobs_version,)).fetchall()
+
+    def queue_refresh(self, jobs):
+        """Hand a job list read on a background thread to the Tk thread."""
+        # A newer job list replaces one that has not been shown yet, so only one flush is ever pending
+        with self.refresh_lock:
+            scheduled = self.pending_refresh is not None
+            self.pending_refresh = jobs
+        if not scheduled:
+            self.after_idle(self.flush_pending_refresh)
+
+    def flush_pending_refresh(self):
+        """Show the latest queued job list in one pass, then redraw once."""
+        with self.refresh_lock:
+            jobs, self.pending_refresh = self.pending_refresh, None
+        self.apply_refresh(jobs)
+        self.update_sync_time()
+        self.jobs_frame.update_idletasks()
 
-        # Set of current job IDs 
-        existing_job_ids = set(self.job_rows.keys())
+    def apply_refresh(self, jobs):
+        """Apply the changed jobs read by fetch_jobs to the job rows. Must run on the Tk thread."""
+        # Jobs at or below the applied version were already shown by a newer refresh
+        applied_version = self.jobs_version
 
         for job in jobs:
-            (job_id, company, position, status, app_date, last_updated, content, updated) = job
-            if job_id not in self.job_rows:
-                self.add_job_row(job_id, company, position, status, app_date, last_updated, content, updated)
-                logging.info(f"Added job with ID {job_id}")
+            (job_id, company, position, status, app_date, last_updated, updated, is_deleted, version) = job
+            if version <= applied_version:
+                continue
+            self.jobs_version = max(self.jobs_version, version)
+
+            if is_deleted:
+                # Queued jobs that were deleted before their rows were created are dropped as well
+                self.pending_jobs.pop(job_id, None)
+                if job_id in self.job_rows:
+                    logging.info(f"Removing job with ID {job_id} from UI")
+                    self.remove_job_row(job_id)
+            elif job_id not in self.job_rows:
+                # New rows are created in batches by add_pending_rows
+                self.pending_jobs[job_id] = (job_id, company, position, status, app_date, last_updated, updated)
             else:
-                self.update_job_row(job_id, "company", company)
-                self.update_job_row(job_id, "position", position)
-                self.update_job_row(job_id, "status", status)
-                self.update_job_row(job_id, "application_date", app_date)
-                self.update_job_row(job_id, "last_updated", last_updated)
-                self.update_job_row(job_id, "updated", updated)
-                logging.info(f"Checked job with ID {job_id} for update")
-            # Once added or updated, remove from set
-            existing_job_ids.discard(job_id)
-
-        # Remove any leftover jobs from the UI
-        for job_id in existing_job_ids:
-            logging.info(f"Removing job with ID {job_id} from UI")
-            self.remove_job_row(job_id)
-        
+                # Only touch the widgets whose values changed since the last refresh
+                snapshot = (company, position, status, app_date, last_updated, updated)
+                old_snapshot = self.job_rows[job_id].snapshot
+                if snapshot != old_snapshot:
+                    for field, old_value, value in zip(REFRESH_FIELDS, old_snapshot, snapshot):
+                        if value != old_value:
+                            self.update_job_row(job_id, field, value)
+                    if status != old_snapshot[2]:
+                        self.update_status_color(self.job_rows[job_id].status, status)
+                    self.job_rows[job_id].snapshot = snapshot
+                    logging.info(f"Updated job with ID {job_id}")
+
+        if not self.pending_rows_scheduled:
+            self.add_pending_rows()
+
         logging.info("Job list refreshed.")
-        self.update_sync_time()
 
-    def add_job_row(self, job_id, company, position, status, app_date, last_updated, content, updated):
-        """Add a new job row to the UI."""
-        row = self.next_row
-        self.next_row += 1
+    def add_pending_rows(self):
+        """Create rows for the next batch of queued jobs, then yield to the event loop."""
+        # Building every row at once would block the first paint of a long job list
+        self.pending_rows_scheduled = False
+        for _ in range(min(ROW_BATCH_SIZE, len(self.pending_jobs))):
+            job_id = next(iter(self.pending_jobs))
+            self.add_job_row(*self.pending_jobs.pop(job_id))
+            logging.info(f"Added job with ID {job_id}")
+
+        if self.pending_jobs:
+            self.pending_rows_scheduled = True
+            self.after(1, self.add_pending_rows)
 
-        # Create update indicator
-        update_indicator = ctk.CTkLabel(self.jobs_frame, text="!", text_color="orange", width=20, font=("Arial", 28, "bold"))
-        update_indicator.grid(row=row, column=0, padx=(0, 5), pady=(10, 2), sticky="w")
-        update_indicator.bind("<Button-1>", lambda e, j=job_id: self.clear_update_indicator(j))
+    def add_job_row(self, job_id, company, position, status, app_date, last_updated, updated):
+        """Add a new job row to the UI."""
+        # Building CTk widgets is slow, so a removed job's hidden widgets are reused first
+        if self.row_pool:
+            self.reuse_job_row(job_id, company, position, status, app_date, last_updated, updated)
+            return
 
-        # Hide update indicator if job is not updated
-        if not updated:
-            update_indicator.grid_remove()
+        # Reuse the lowest grid row freed by a removed job before growing the grid
+        if self.free_rows:
+            row = heapq.heappop(self.free_rows)
+        else:
+            row = self.next_row
+            self.next_row += 1
 
         # Create and place widgets for each job field
         # Company
         company_entry = ctk.CTkEntry(self.jobs_frame, width=150)
         company_entry.insert(0, company)
         company_entry.grid(row=row, column=0, padx=(25, 5), pady=(10, 2), sticky="ew")
-        company_entry.bind("<FocusOut>", lambda e, j=job_id, w=company_entry: self.validate_and_update(j, "company", w.get(), w))
+        company_entry.job_id = job_id
+        company_entry.field = "company"
+        company_entry.bind("<FocusOut>", self.on_focus_out)
 
         # Position
         position_entry = ctk.CTkEntry(self.jobs_frame, width=150)
         position_entry.insert(0, position)
         position_entry.grid(row=row, column=1, padx=5, pady=(10, 2), sticky="ew")
-        position_entry.bind("<FocusOut>", lambda e, j=job_id, w=position_entry: self.validate_and_update(j, "position", w.get(), w))
+        position_entry.job_id = job_id
+        position_entry.field = "position"
+        position_entry.bind("<FocusOut>", self.on_focus_out)
 
         # Status
         status_var = ctk.StringVar(value=status)
-        status_dropdown = ctk.CTkOptionMenu(self.jobs_frame, variable=status_var, values=["Applied", "Interview", "Offer", "Rejected"], width=100)
+        status_dropdown = ctk.CTkOptionMenu(self.jobs_frame, variable=status_var, values=STATUS_VALUES, width=100)
         status_dropdown.grid(row=row, column=2, padx=5, pady=(10, 2), sticky="ew")
-        status_dropdown.configure(command=lambda v, j=job_id: self.update_job(j, "status", v))
+        status_dropdown.configure(command=partial(self.update_job, job_id, "status"))
         # Set color based on status
         self.update_status_color(status_dropdown, status)
 
@@ -512,97 +833,162 @@ class HomeScreen(ctk.CTk):
         app_date_entry = ctk.CTkEntry(self.jobs_frame, width=100)
         app_date_entry.insert(0, app_date)
         app_date_entry.grid(row=row, column=3, padx=5, pady=(10, 2), sticky="ew")
-        app_date_entry.bind("<FocusOut>", lambda e, j=job_id, w=app_date_entry: self.validate_and_update(j, "application_date", w.get(), w))
+        app_date_entry.job_id = job_id
+        app_date_entry.field = "application_date"
+        app_date_entry.bind("<FocusOut>", self.on_focus_out)
 
         # Last Updated
         last_updated_label = ctk.CTkLabel(self.jobs_frame, text=last_updated, width=100)
         last_updated_label.grid(row=row, column=4, padx=5, pady=(10, 2), sticky="ew")
 
         # Content
-        content_button = ctk.CTkButton(self.jobs_frame, text="Content", width=50, command=lambda j=job_id, c=content: self.open_content(j, c))
+        content_button = ctk.CTkButton(self.jobs_frame, text="Content", width=50, command=partial(self.open_content, job_id))
         content_button.grid(row=row, column=5, padx=5, pady=(10, 2))
         
         # Delete Button
-        delete_button = ctk.CTkButton(self.jobs_frame, text="✕", width=30, height=30,fg_color="red", hover_color="dark red", command=lambda j=job_id: self.delete_job(j))
+        delete_button = ctk.CTkButton(self.jobs_frame, text="✕", width=30, height=30,fg_color="red", hover_color="dark red", command=partial(self.delete_job, job_id))
         delete_button.grid(row=row, column=6, padx=(5, 10), pady=(10, 2))
 
         # Store references to row widgets
-        self.job_rows[job_id] = {
-            "row": row,
-            "update_indicator": update_indicator,
-            "company": company_entry,
-            "position": position_entry,
-            "status": status_dropdown,
-            "application_date": app_date_entry,
-            "last_updated": last_updated_label,
-            "content": content_button,
-            "delete": delete_button,
-        }
+        self.job_rows[job_id] = JobRow(
+            row=row,
+            update_indicator=None,
+            company=company_entry,
+            position=position_entry,
+            status=status_dropdown,
+            application_date=app_date_entry,
+            last_updated=last_updated_label,
+            content=content_button,
+            delete=delete_button,
+            company_value=company,
+            position_value=position,
+            status_value=status,
+            application_date_value=app_date,
+            snapshot=(company, position, status, app_date, last_updated, updated),
+        )
+
+        if updated:
+            self.show_update_indicator(job_id)
+
+    def reuse_job_row(self, job_id, company, position, status, app_date, last_updated, updated):
+        """Fill the lowest pooled row's widgets with a job and show them again."""
+        _, job_row = heapq.heappop(self.row_pool)
+        for field, value in (("company", company), ("position", position), ("application_date", app_date)):
+            entry = getattr(job_row, field)
+            entry.delete(0, ctk.END)
+            entry.insert(0, value)
+            entry.job_id = job_id
+        job_row.status.set(status)
+        job_row.status.configure(command=partial(self.update_job, job_id, "status"))
+        self.update_status_color(job_row.status, status)
+        job_row.last_updated.configure(text=last_updated)
+        job_row.content.configure(command=partial(self.open_content, job_id))
+        job_row.delete.configure(command=partial(self.delete_job, job_id))
+
+        job_row.company_value = company
+        job_row.position_value = position
+        job_row.status_value = status
+        job_row.application_date_value = app_date
+        job_row.snapshot = (company, position, status, app_date, last_updated, updated)
+
+        # grid() with no options restores the position the widget had before grid_remove()
+        for widget in job_row.widgets():
+            widget.grid()
+        self.job_rows[job_id] = job_row
+
+        if updated:
+            self.show_update_indicator(job_id)
+
+    def show_update_indicator(self, job_id):
+        """Show the update indicator for a job, creating it on first use."""
+        # Most jobs are never updated by email, so rows do not get an indicator up front
+        job_row = self.job_rows[job_id]
+        if job_row.update_indicator is None:
+            update_indicator = ctk.CTkLabel(self.jobs_frame, text="!", text_color="orange", width=20, font=self.indicator_font)
+            update_indicator.grid(row=job_row.row, column=0, padx=(0, 5), pady=(10, 2), sticky="w")
+            update_indicator.bind("<Button-1>", lambda e, j=job_id: self.clear_update_indicator(j))
+            job_row.update_indicator = update_indicator
+        else:
+            job_row.update_indicator.grid()
+
+    def on_focus_out(self, event):
+        """Validate and save the job field whose entry lost focus."""
+        # CTkEntry binds events on its inner tkinter Entry, whose master is the CTkEntry
+        entry = event.widget.master
+        self.validate_and_update(entry.job_id, entry.field, entry.get(), entry)
 
     def update_status_color(self, dropdown, status):
         """Update the color of the status dropdown based on the current status."""
-        color_map = {"Applied": "blue", "Interview": "orange", "Offer": "green", "Rejected": "red"}
-        dropdown.configure(fg_color=color_map.get(status, "gray"))
+        dropdown.configure(fg_color=STATUS_COLORS.get(status, "gray"))
 
     def update_job_row(self, job_id, field, value):
         """Update a specific field in a job row on the home screen."""
-        if job_id in self.job_rows:
-            if field == "last_updated":
-                self.job_rows[job_id]["last_updated"].configure(text=value)
-            elif field in ["company", "position", "application_date"]:
-                if field in self.job_rows[job_id]:
-                    self.job_rows[job_id][field].delete(0, ctk.END)
-                    self.job_rows[job_id][field].insert(0, value)
-                else:
-                    logging.warning(f"Field '{field}' not found in job_rows for job_id {job_id}")
-            elif field == "status":
-                self.job_rows[job_id]["status"].set(value)
-            elif field == "content":
-                # We don't need to update the UI for content, as it's handled in a separate window
-                pass
-            elif field == "updated":
-                if value:
-                    self.job_rows[job_id]["update_indicator"].grid()
-                else:
-                    self.job_rows[job_id]["update_indicator"].grid_remove()
+        # Widgets already showing the value are left alone, e.g. an entry the user just saved
+        job_row = self.job_rows.get(job_id)
+        if job_row is not None:
+            updater = self.row_updaters.get(field)
+            if updater is not None:
+                updater(job_id, job_row, value)
             else:
                 logging.warning(f"Warning: Unhandled field '{field}' in update_job_row")
+
+    def update_entry_field(self, field, job_id, job_row, value):
+        """Show a new value in one of a row's entries."""
+        entry = getattr(job_row, field)
+        if entry.get() != value:
+            entry.delete(0, ctk.END)
+            entry.insert(0, value)
+        setattr(job_row, field + "_value", value)
+
+    def update_status_field(self, job_id, job_row, value):
+        """Show a new status in a row's dropdown."""
+        if job_row.status.get() != value:
+            job_row.status.set(value)
+        job_row.status_value = value
+
+    def update_last_updated_field(self, job_id, job_row, value):
+        """Show a new last updated date in a row."""
+        if job_row.last_updated.cget("text") != value:
+            job_row.last_updated.configure(text=value)
+
+    def update_updated_field(self, job_id, job_row, value):
+        """Show or hide a row's update indicator."""
+        if value:
+            self.show_update_indicator(job_id)
+        elif job_row.update_indicator is not None:
+            job_row.update_indicator.grid_remove()
                 
     def clear_update_indicator(self, job_id):
         """Clear the update indicator for a job."""
-        conn = sqlite3.connect("job_applications.db")
-        cursor = conn.cursor()
-        cursor.execute("UPDATE jobs SET updated = 0 WHERE id = ?", (job_id,))
-        conn.commit()
-        conn.close()
+        with self.db_lock, self.conn:
+            self.conn.execute("UPDATE jobs SET updated = 0 WHERE id = ?", (job_id,))
         self.update_job_row(job_id, "updated", False)
 
     def remove_job_row(self, job_id):
-        """Remove a job row from the UI and adjust remaining rows."""
+        """Remove a job row from the UI."""
         if job_id in self.job_rows:
-            row = self.job_rows[job_id]["row"]
-
-            # Destroy all widgets in the row
-            for widget in self.job_rows[job_id].values():
-                if isinstance(
-                    widget,
-                    (ctk.CTkEntry, ctk.CTkLabel, ctk.CTkButton, ctk.CTkOptionMenu),
-                ):
+            # Remove the job from our tracking dictionary. The other rows keep their
+            # grid rows, since an empty grid row takes up no space.
+            job_row = self.job_rows.pop(job_id)
+
+            # Drop the job's debounced saves, so none is written after its widgets are reused
+            for field in EDITABLE_FIELDS:
+                self.cancel_pending_write(job_id, field)
+
+            # The indicator's click handler is bound to this job, so it is never reused
+            if job_row.update_indicator is not None:
+                job_row.update_indicator.destroy()
+                job_row.update_indicator = None
+
+            # Hide the widgets for the next job added, or destroy them and free the grid row
+            if len(self.row_pool) < ROW_POOL_SIZE:
+                for widget in job_row.widgets():
+                    widget.grid_remove()
+                heapq.heappush(self.row_pool, (job_row.row, job_row))
+            else:
+                for widget in job_row.widgets():
                     widget.destroy()
-
-            # Remove the job from our tracking dictionary
-            del self.job_rows[job_id]
-
-            # Shift remaining rows up
-            for other_job_id, job_data in self.job_rows.items():
-                if job_data["row"] > row:
-                    job_data["row"] -= 1
-                    for widget in job_data.values():
-                        if isinstance(widget, (ctk.CTkEntry, ctk.CTkLabel, ctk.CTkButton, ctk.CTkOptionMenu,)):
-                            widget.grid(row=job_data["row"])
-
-            # Update the next available row
-            self.next_row -= 1
+                heapq.heappush(self.free_rows, job_row.row)
         else:
             logging.warning(f"Attempted to remove non-existent job with ID {job_id}")
 